@@ -35,7 +35,6 @@ def _format_domain_response(
 
     order_ids: List[str] = metadata["order_ids"]
     courier_ids: List[str] = metadata["courier_ids"]
-    index_to_order_id = {index: order_id for order_id, index in metadata["order_index_by_id"].items()}
 
     routes: List[List[int]] = solver_result.get("routes", [])
     t_departure: List[int] = solver_result.get("t_departure", [])
@@ -66,7 +65,8 @@ def _format_domain_response(
                 total_minutes += travel
                 prev_node = node
                 if node != 0:
-                    order_id = index_to_order_id[node]
+                    # order indices are dense 1..N, aligned with order_ids
+                    order_id = order_ids[node - 1]
                     order_assignments[order_id] = courier_id
                     delivery_sequence.append(
                         CourierStop(position=position, order_id=order_id)
@@ -89,8 +89,7 @@ def _format_domain_response(
     order_plans: List[OrderPlan] = []
     assigned_orders = 0
 
-    for order_id in order_ids:
-        order_index = metadata["order_index_by_id"][order_id]
+    for order_index, order_id in enumerate(order_ids, start=1):
         skipped = bool(skip_flags.get(order_index, 0))
         assigned_courier_id = order_assignments.get(order_id)
         delivery_minutes = t_delivery.get(order_index)
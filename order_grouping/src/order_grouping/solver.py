@@ -1,4 +1,6 @@
 from typing import Any, Dict, List, Tuple
+
+import numpy as np
 from ortools.sat.python import cp_model
 
 
@@ -78,7 +80,9 @@ class Solver:
         # --------
         # Оценка большого M (динамически разумная верхняя граница)
         # --------
-        max_tau = max(tau[i][j] for i in nodes for j in nodes if i != j)
+        # Векторно по всей матрице: диагональ (i == j) исключаем маской
+        tau_arr = np.asarray(tau, dtype=np.int64)
+        max_tau = int(tau_arr.max(initial=0, where=~np.eye(N + 1, dtype=bool)))
         # Верхняя оценка времени доставки: max(courier_available_offset_k, max order_ready_offset_i)
         # плюс запас (N+1)*max_tau
         max_courier_available = max(courier_available_offset) if courier_available_offset else 0
@@ -132,17 +136,20 @@ class Solver:
         for i in orders:
             model.Add(sum(assigned_to_courier[(i, k)] for k in range(K)) + skip[i] == 1)
 
-        # (2) Вместимость по коробкам у каждого курьера
         for k in range(K):
+            # Назначения курьера k собираем за один проход и переиспользуем в (2) и связи с used_k
+            courier_assignments = [assigned_to_courier[(i, k)] for i in orders]
+            assigned_count = cp_model.LinearExpr.Sum(courier_assignments)
+
+            # (2) Вместимость по коробкам у каждого курьера
             model.Add(
-                sum(boxes_per_order[i - 1] * assigned_to_courier[(i, k)] for i in orders)
+                sum(boxes * assigned for boxes, assigned in zip(boxes_per_order, courier_assignments))
                 <= courier_capacity_boxes[k]
             )
 
-        # Связь used_k с assigned_to_courier: used_k == 1, если есть хотя бы один назначенный заказ
-        for k in range(K):
-            model.Add(sum(assigned_to_courier[(i, k)] for i in orders) >= 1).OnlyEnforceIf(used[k])
-            model.Add(sum(assigned_to_courier[(i, k)] for i in orders) == 0).OnlyEnforceIf(used[k].Not())
+            # Связь used_k с assigned_to_courier: used_k == 1, если есть хотя бы один назначенный заказ
+            model.Add(assigned_count >= 1).OnlyEnforceIf(used[k])
+            model.Add(assigned_count == 0).OnlyEnforceIf(used[k].Not())
 
         # (3) Доступность и готовность: t_departure_k >= courier_available_offset_k
         # и t_departure_k >= order_ready_offset_i при назначении
@@ -178,10 +185,12 @@ class Solver:
                 )
             # i -> j (оба — заказы)
             for i in orders:
+                tau_i = tau[i]
+                t_delivery_i = t_delivery[i]
                 for j in orders:
                     if i != j:
                         model.Add(
-                            t_delivery[j] >= t_delivery[i] + tau[i][j] - M * (1 - y[(i, j, k)])
+                            t_delivery[j] >= t_delivery_i + tau_i[j] - M * (1 - y[(i, j, k)])
                         )
             # Времени для j=depot не задаём — t_delivery[depot] не определено/не требуется.
 
@@ -264,9 +273,14 @@ class Solver:
                 routes.append([0, 0])
                 continue
 
+            # Дуги y[i,j,k]=1 возможны только между заказами, назначенными курьеру k
+            # (степени входа/выхода равны assigned_to_courier), поэтому кандидатов
+            # на следующий узел ищем только среди них, а не среди всех N заказов.
+            courier_orders = [i for i in orders if assigned_val[(i, k)] == 1]
+
             # ищем первый узел после депо
             next_from_depot = None
-            for j in orders:
+            for j in courier_orders:
                 if int(solver.Value(y[(depot, j, k)])) == 1:
                     next_from_depot = j
                     break
@@ -288,7 +302,7 @@ class Solver:
                     break
 
                 found_next = False
-                for j in orders:
+                for j in courier_orders:
                     if j != current and int(solver.Value(y[(current, j, k)])) == 1:
                         route.append(j)
                         if j in visited:
@@ -77,6 +77,33 @@ def test_mapping_allows_ready_before_created(sample_payload: dict) -> None:
     assert mapped["order_created_offset"][0] == -10
 
 
+def test_mapping_rounds_offsets_to_nearest_minute(sample_payload: dict) -> None:
+    payload = sample_payload
+    payload["orders"][0]["created_at_utc"] = "2024-01-01T11:44:31Z"
+    payload["orders"][0]["expected_ready_at_utc"] = "2024-01-01T12:05:29Z"
+    payload["couriers"][0]["expected_courier_return_at_utc"] = "2024-01-01T12:01:30Z"
+
+    request_model = DomainSolveRequest(**payload)
+    mapped = map_domain_request(request_model)
+
+    assert mapped["order_created_offset"] == [-15, -10]
+    assert mapped["order_ready_offset"] == [5, 10]
+    assert mapped["courier_available_offset"] == [2]
+
+
+def test_mapping_accepts_utc_suffix_variants(sample_payload: dict) -> None:
+    payload = sample_payload
+    payload["current_timestamp_utc"] = "2024-01-01T12:00:00z"
+    payload["orders"][0]["created_at_utc"] = "2024-01-01T14:45:00+03:00"
+    payload["couriers"][0]["expected_courier_return_at_utc"] = "2024-01-01T12:00:00"
+
+    request_model = DomainSolveRequest(**payload)
+    mapped = map_domain_request(request_model)
+
+    assert mapped["order_created_offset"][0] == -15
+    assert mapped["courier_available_offset"] == [0]
+
+
 def test_solve_domain_endpoint(sample_payload: dict) -> None:
     client = TestClient(app)
 
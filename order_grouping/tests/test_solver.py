@@ -380,3 +380,53 @@ class TestSolver:
                     "W_c2e": 1,
                 }
             )
+
+    def test_tc_015_no_orders(self) -> None:
+        """TC-015 Пустой вход: ни одного заказа.
+
+        Expected: status=OPTIMAL, route [0,0], пустые словари, objective=0.
+        Notes: Матрица tau 1x1 (только депо) не должна ломать оценку большого M.
+        """
+        result = self._solve(
+            {
+                "tau": [[0]],
+                "courier_capacity_boxes": [3],
+                "boxes_per_order": [],
+                "order_created_offset": [],
+                "order_ready_offset": [],
+                "courier_available_offset": [0],
+                "W_cert": 100,
+                "W_c2e": 1,
+                "W_skip": 1000,
+            }
+        )
+
+        assert result["status"] == "OPTIMAL"
+        assert result["routes"] == [[0, 0]]
+        assert result["t_delivery"] == {}
+        assert result["skip"] == {}
+        assert result["objective"] == 0
+
+    def test_tc_016_integral_float_box_counts(self) -> None:
+        """TC-016 Количество коробок пришло как целые float (сырой вход /solve-internal).
+
+        Expected: status=OPTIMAL, route [0,1,0], skip1=0.
+        Notes: 1.0 должно приниматься так же, как 1.
+        """
+        result = self._solve(
+            {
+                "tau": [[0, 10], [10, 0]],
+                "courier_capacity_boxes": [10],
+                "boxes_per_order": [1.0],
+                "order_created_offset": [0],
+                "order_ready_offset": [0],
+                "courier_available_offset": [0],
+                "W_cert": 100,
+                "W_c2e": 1,
+                "W_skip": 1000,
+            }
+        )
+
+        assert result["status"] == "OPTIMAL"
+        assert result["routes"] == [[0, 1, 0]]
+        assert result["skip"][1] == 0